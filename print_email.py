@@ -4,14 +4,101 @@ import os
 import logging
 import tempfile
 import subprocess
+import shutil
 import smtplib
 import time
 import re
+import queue
+import atexit
+import threading
+import signal
+import functools
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 from email.header import decode_header
-from logging.handlers import RotatingFileHandler
-import io
-from translations import get_translation, get_available_languages
+from email.parser import BytesFeedParser
+from email.policy import compat32
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import binascii
+from translations import get_available_languages, make_translator
+
+# pycups submits jobs over the CUPS socket; without it we shell out to lp
+try:
+    import cups
+except ImportError:
+    cups = None
+
+# lxml extracts HTML text in C; without it a regex scan is used
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# Errors meaning a print job could not be submitted
+PRINT_ERRORS = (subprocess.CalledProcessError,)
+if cups is not None:
+    PRINT_ERRORS += (cups.IPPError, cups.HTTPError, RuntimeError)
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a 64KB buffer instead of flushing
+    after every record. WARNING and above are flushed immediately; everything
+    else is flushed by a background thread every few seconds.
+    The file size is tracked in a running byte count: the stock rollover
+    check calls seek()/tell(), which would flush the buffer on every record.
+    """
+
+    def __init__(self, *args, flush_interval=5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._flush_stop = threading.Event()
+        threading.Thread(target=self._flush_periodically, args=(flush_interval,), daemon=True).start()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=64*1024,
+                      encoding=self.encoding, errors=self.errors)
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _flush_periodically(self, interval):
+        while not self._flush_stop.wait(interval):
+            self.flush()
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.stream.encoding, self.stream.errors))
+            if self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += size
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._flush_stop.set()
+        super().close()
+
+class LogCaptureHandler(logging.Handler):
+    """
+    Collects the records logged while one email is processed, for the
+    detailed confirmation. Records beyond the first `capacity` are dropped.
+    """
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.capacity = capacity
+        self.records = []
+
+    def emit(self, record):
+        if len(self.records) < self.capacity:
+            self.records.append(record)
 
 # Logging setup with rotation to prevent unbounded log growth
 log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
@@ -20,12 +107,18 @@ logger.setLevel(logging.INFO)
 
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(log_formatter)
-logger.addHandler(console_handler)
 
 # Rotate logs at 5MB, keep 3 backup files
-file_handler = RotatingFileHandler("email2print.log", maxBytes=5*1024*1024, backupCount=3)
+file_handler = BufferedRotatingFileHandler("email2print.log", maxBytes=5*1024*1024, backupCount=3, encoding="utf-8")
 file_handler.setFormatter(log_formatter)
-logger.addHandler(file_handler)
+
+# Log calls only enqueue the record; console and file I/O (including the
+# rotation size check) happen on the listener's background thread
+log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 
 # Helper to get env variables
@@ -33,11 +126,24 @@ def get_env_var(name, required=False, default=None):
     val = os.getenv(name)
     if val is None or val == "":
         if required:
-            logger.error(get_translation("missing_env_var", LANGUAGE, var=name))
+            logger.error(_t("missing_env_var", var=name))
             raise ValueError(f"Missing required environment variable: {name}")
         return default
     return val
 
+# Language setting - supports any language code in translations.py
+LANGUAGE = get_env_var("LANGUAGE", default="en").lower()
+if LANGUAGE not in get_available_languages():
+    logger.warning(f"Language '{LANGUAGE}' not available. Falling back to 'en'. Available: {get_available_languages()}")
+    LANGUAGE = "en"
+
+# The language is fixed for the process lifetime, so bind it once
+_t = make_translator(LANGUAGE, memoize=(
+    # Logged over and over with the same small parameters by the scan loop
+    # and the IMAP retries
+    "sleeping", "found_messages", "connecting_imap", "retrying_in",
+))
+
 # Environment Configuration
 EMAIL_ACCOUNT = get_env_var("EMAIL_ACCOUNT", required=True)
 EMAIL_PASSWORD = get_env_var("EMAIL_PASSWORD", required=True)
@@ -58,24 +164,50 @@ SLEEP_TIME = int(get_env_var("SLEEP_TIME", default=60))
 CONFIRM_SUBJECT = get_env_var("CONFIRM_SUBJECT", default=None)  # Will use translation if not set
 ALLOWED_ATTACHMENT_TYPES = [ext.strip().lower() for ext in get_env_var("ALLOWED_ATTACHMENT_TYPES", default="").split(",") if ext]
 ALLOWED_RECIPIENTS = [addr.strip().lower() for addr in get_env_var("ALLOWED_RECIPIENTS", default="").split(",") if addr]
+# Set lookups for sender checks: exact addresses and @domain wildcards
+ALLOWED_EMAILS = frozenset(addr for addr in ALLOWED_RECIPIENTS if not addr.startswith("@"))
+ALLOWED_DOMAINS = frozenset(addr for addr in ALLOWED_RECIPIENTS if addr.startswith("@"))
 DETAILED_CONFIRMATION = get_env_var("DETAILED_CONFIRMATION", default="false").lower() == "true"
 DELETE_AFTER_PRINT = get_env_var("DELETE_AFTER_PRINT", default="false").lower() == "true"
 
 # Security: Max file size limit (in MB) to prevent resource exhaustion attacks
 MAX_FILE_SIZE_MB = int(get_env_var("MAX_FILE_SIZE_MB", default=10))
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+# Attachments are decoded to disk in blocks of roughly this much encoded text
+DECODE_CHUNK_SIZE = 64 * 1024
+# Parts of one email decoded to temp files in parallel
+MAX_PRINT_WORKERS = 4
+# Upper bound for a single os.write() of decoded data
+WRITE_CHUNK_SIZE = 1024 * 1024
+# Raw messages are fed to the MIME parser in blocks of this size
+FEED_CHUNK_SIZE = 64 * 1024
+
+# Most log records included in one detailed confirmation
+LOG_CAPTURE_MAX_RECORDS = 1024
+
+# Confirmation emails reuse one SMTP session, recycled after this many messages
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+# Sessions idle longer than this are replaced; servers time idle sessions out
+SMTP_IDLE_TIMEOUT = 60
+# Replies meaning the server closed the session (-1: connection reset)
+SMTP_RECONNECT_CODES = (421, -1)
 
 # Connection retry settings for IMAP resilience
 MAX_IMAP_RETRIES = int(get_env_var("MAX_IMAP_RETRIES", default=3))
 IMAP_RETRY_DELAY = int(get_env_var("IMAP_RETRY_DELAY", default=5))
 
-# Language setting - supports any language code in translations.py
-LANGUAGE = get_env_var("LANGUAGE", default="en").lower()
-if LANGUAGE not in get_available_languages():
-    logger.warning(f"Language '{LANGUAGE}' not available. Falling back to 'en'. Available: {get_available_languages()}")
-    LANGUAGE = "en"
+# IMAP IDLE is re-issued before the 30 minute server timeout (RFC 2177)
+IDLE_TIMEOUT = 29 * 60
+# How often a pending IDLE checks whether a shutdown was requested
+IDLE_CHECK_INTERVAL = 1
+# Send NOOP on a session quiet for this long, before servers drop it as idle
+IMAP_KEEPALIVE = 25 * 60
+# Errors that mean the IMAP session is gone and must be re-established
+# (ssl.SSLError and socket errors are subclasses of OSError)
+IMAP_ERRORS = (imapclient.exceptions.IMAPClientError, OSError)
 
 
+@functools.lru_cache(maxsize=512)
 def decode_mime_words(s):
     if not s:
         return ""
@@ -84,9 +216,30 @@ def decode_mime_words(s):
         for part, enc in decode_header(s)
     )
 
+# Matches a single HTML tag in a raw (undecoded) HTML body
+_TAG_RE = re.compile(rb"<[^>]+>")
+# Matches any visible (non-whitespace) byte
+_VISIBLE_RE = re.compile(rb"\S")
+
 def is_mostly_html_blank(html):
-    cleaned = re.sub(r"<[^>]+>", "", html or "").strip()
-    return cleaned == ""
+    """
+    Check whether an HTML body (bytes) contains only tags and whitespace.
+    Uses libxml2 through lxml when available. Otherwise searches the text
+    between tags in place and stops at the first visible character.
+    """
+    if not html:
+        return True
+    if lxml_html is not None:
+        try:
+            return not lxml_html.fromstring(html).text_content().strip()
+        except (etree.ParserError, ValueError):
+            return True
+    pos = 0
+    for match in _TAG_RE.finditer(html):
+        if _VISIBLE_RE.search(html, pos, match.start()):
+            return False
+        pos = match.end()
+    return not _VISIBLE_RE.search(html, pos)
 
 # File types that require conversion through LibreOffice Writer before printing
 # Only includes formats supported by libreoffice-writer (no calc/impress needed)
@@ -115,95 +268,186 @@ def convert_with_libreoffice(input_path, output_dir):
         pdf_path = os.path.join(output_dir, f"{base_name}.pdf")
         
         if os.path.exists(pdf_path):
-            logger.info(get_translation("libreoffice_conversion_success", LANGUAGE, 
-                                       input=input_path, output=pdf_path))
+            logger.info(_t("libreoffice_conversion_success", 
+                          input=input_path, output=pdf_path))
             return pdf_path
         else:
-            logger.error(get_translation("libreoffice_conversion_failed", LANGUAGE, path=pdf_path))
+            logger.error(_t("libreoffice_conversion_failed", path=pdf_path))
             return None
             
     except subprocess.TimeoutExpired:
-        logger.error(get_translation("libreoffice_timeout", LANGUAGE, path=input_path))
+        logger.error(_t("libreoffice_timeout", path=input_path))
         return None
     except subprocess.CalledProcessError as e:
-        logger.error(get_translation("libreoffice_error", LANGUAGE, path=input_path, error=e.stderr))
+        logger.error(_t("libreoffice_error", path=input_path, error=e.stderr))
         return None
     except Exception as e:
-        logger.error(get_translation("libreoffice_unexpected_error", LANGUAGE, error=str(e)))
+        logger.error(_t("libreoffice_unexpected_error", error=str(e)))
+        return None
+
+_cups_connection = None
+
+def get_cups_connection():
+    """Return the shared CUPS connection, opening it on first use"""
+    global _cups_connection
+    if _cups_connection is None:
+        _cups_connection = cups.Connection()
+    return _cups_connection
+
+def submit_print_job(paths):
+    """
+    Send files to the printer as a single job, through the CUPS API when
+    pycups is installed and through the lp command otherwise.
+    Returns: CUPS job id, or None when submitted with lp
+    """
+    if cups is None:
+        subprocess.run(["lp", "-d", PRINTER_NAME, *paths], check=True)
         return None
+    return get_cups_connection().printFiles(PRINTER_NAME, paths, "email2print", {})
 
-def print_file(file_path):
+def print_files(file_paths):
     """
-    Print file directly or convert to PDF first if needed.
-    Handles Office documents, images, PDFs, and text files.
+    Print several files with a single lp invocation, converting them to PDF
+    first where needed. Handles Office documents, images, PDFs, and text files.
+    Returns: list of the given paths that were sent to the printer.
     """
-    file_ext = os.path.splitext(file_path)[1].lower().lstrip('.')
-    pdf_to_clean = None
+    to_print = []  # (original path, path handed to lp)
+    temp_dirs = []
     
     try:
-        # Check if file needs conversion through LibreOffice
-        if file_ext in LIBREOFFICE_FORMATS:
-            logger.info(get_translation("libreoffice_conversion_required", LANGUAGE, ext=file_ext))
-            temp_dir = tempfile.mkdtemp()
-            
-            try:
+        for file_path in file_paths:
+            file_ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+
+            # Check if file needs conversion through LibreOffice
+            if file_ext in LIBREOFFICE_FORMATS:
+                logger.info(_t("libreoffice_conversion_required", ext=file_ext))
+                temp_dir = tempfile.mkdtemp()
+                temp_dirs.append(temp_dir)
+
                 pdf_path = convert_with_libreoffice(file_path, temp_dir)
                 if not pdf_path:
-                    logger.error(get_translation("libreoffice_conversion_failed_cannot_print", LANGUAGE, path=file_path))
-                    return False
-                
-                # Print the converted PDF
-                pdf_to_clean = pdf_path
-                subprocess.run(["lp", "-d", PRINTER_NAME, pdf_path], check=True)
-                logger.info(get_translation("sent_to_printer", LANGUAGE, printer=PRINTER_NAME, path=pdf_path))
-                
-            finally:
-                # Clean up temporary directory and converted PDF
-                try:
-                    if pdf_to_clean and os.path.exists(pdf_to_clean):
-                        os.remove(pdf_to_clean)
-                    os.rmdir(temp_dir)
-                except Exception as e:
-                    logger.warning(get_translation("temp_cleanup_failed", LANGUAGE, error=str(e)))
-        else:
-            # Print directly for PDF, text, images, PostScript
-            subprocess.run(["lp", "-d", PRINTER_NAME, file_path], check=True)
-            logger.info(get_translation("sent_to_printer", LANGUAGE, printer=PRINTER_NAME, path=file_path))
-        
-        return True
+                    logger.error(_t("libreoffice_conversion_failed_cannot_print", path=file_path))
+                    continue
+                to_print.append((file_path, pdf_path))
+            else:
+                # Print directly for PDF, text, images, PostScript
+                to_print.append((file_path, file_path))
+
+        if not to_print:
+            return []
+
+        print_paths = [path for _, path in to_print]
+        try:
+            job_id = submit_print_job(print_paths)
+        except PRINT_ERRORS as e:
+            logger.error(_t("printing_failed", path=", ".join(print_paths), error=str(e)))
+            return []
+
+        for path in print_paths:
+            logger.info(_t("sent_to_printer", printer=PRINTER_NAME, path=path))
+        if job_id is not None:
+            logger.info(_t("print_job_submitted", job_id=job_id, printer=PRINTER_NAME))
+        return [file_path for file_path, _ in to_print]
         
-    except subprocess.CalledProcessError as e:
-        logger.error(get_translation("printing_failed", LANGUAGE, path=file_path, error=str(e)))
-        return False
+    finally:
+        # Clean up temporary directories and converted PDFs
+        for temp_dir in temp_dirs:
+            try:
+                shutil.rmtree(temp_dir)
+            except Exception as e:
+                logger.warning(_t("temp_cleanup_failed", error=str(e)))
+
+# Confirmation emails share one SMTP session instead of connecting per email
+_smtp_client = None
+_smtp_msgs_sent = 0
+_smtp_last_used = 0.0
+_smtp_lock = threading.Lock()
+
+def _get_smtp():
+    """Return the shared SMTP session, connecting and logging in on first use"""
+    global _smtp_client
+    if _smtp_client is not None and time.monotonic() - _smtp_last_used > SMTP_IDLE_TIMEOUT:
+        # Don't reuse a session the server has probably timed out by now
+        _reset_smtp()
+    if _smtp_client is None:
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=20)
+        try:
+            server.starttls()
+            server.login(SMTP_USERNAME, SMTP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        _smtp_client = server
+    return _smtp_client
+
+def _reset_smtp():
+    """Close the shared SMTP session so the next email opens a fresh one"""
+    global _smtp_client, _smtp_msgs_sent
+    if _smtp_client is not None:
+        try:
+            _smtp_client.quit()
+        except Exception:
+            _smtp_client.close()
+    _smtp_client = None
+    _smtp_msgs_sent = 0
+
+def send_smtp_message(msg):
+    """
+    Send a message over the shared SMTP session.
+    A session dropped or timed out by the server is replaced and the send
+    retried once; sessions are recycled after SMTP_MAX_MESSAGES_PER_CONNECTION
+    messages or SMTP_IDLE_TIMEOUT seconds without use.
+    """
+    global _smtp_msgs_sent, _smtp_last_used
+    with _smtp_lock:
+        try:
+            try:
+                _get_smtp().send_message(msg)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+                if getattr(e, "smtp_code", -1) not in SMTP_RECONNECT_CODES:
+                    raise
+                _reset_smtp()
+                _get_smtp().send_message(msg)
+        except Exception:
+            _reset_smtp()
+            raise
+
+        _smtp_msgs_sent += 1
+        _smtp_last_used = time.monotonic()
+        if _smtp_msgs_sent >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+            _reset_smtp()
+
+atexit.register(_reset_smtp)
 
 def send_confirmation_email(to_email, log_text, printed_files):
     msg = EmailMessage()
     # Use custom subject or translated default
-    msg["Subject"] = CONFIRM_SUBJECT or get_translation("confirmation_subject_default", LANGUAGE)
+    msg["Subject"] = CONFIRM_SUBJECT or _t("confirmation_subject_default")
     msg["From"] = FROM_ADDRESS
     msg["To"] = to_email
 
     if DETAILED_CONFIRMATION:
-        msg.set_content(get_translation("confirmation_processed", LANGUAGE, log=log_text))
+        msg.set_content(_t("confirmation_processed", log=log_text))
     else:
-        lines = [
-            get_translation("confirmation_printed", LANGUAGE, 
-                          timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
-                          filename=fname,
-                          printer=PRINTER_NAME)
-            for fname in printed_files
-        ]
-        msg.set_content("\n".join(lines) if lines else get_translation("confirmation_no_files", LANGUAGE))
+        if printed_files:
+            # All files of one email share the same confirmation timestamp
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+            msg.set_content("\n".join(
+                _t("confirmation_printed", 
+                   timestamp=timestamp,
+                   filename=fname,
+                   printer=PRINTER_NAME)
+                for fname in printed_files
+            ))
+        else:
+            msg.set_content(_t("confirmation_no_files"))
 
     try:
-        logger.info(get_translation("sending_confirmation", LANGUAGE, email=to_email))
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=20) as server:
-            server.starttls()
-            server.login(SMTP_USERNAME, SMTP_PASSWORD)
-            server.send_message(msg)
-        logger.info(get_translation("confirmation_sent", LANGUAGE))
+        logger.info(_t("sending_confirmation", email=to_email))
+        send_smtp_message(msg)
+        logger.info(_t("confirmation_sent"))
     except Exception as e:
-        logger.error(get_translation("confirmation_failed", LANGUAGE, error=str(e)))
+        logger.error(_t("confirmation_failed", error=str(e)))
 
 def extract_sender(msg):
     """Extract and normalize sender email address"""
@@ -216,53 +460,148 @@ def is_sender_allowed(from_addr):
     If list is empty, denies all (security by default).
     """
     if not ALLOWED_RECIPIENTS:
-        logger.warning(get_translation("allowed_recipients_empty", LANGUAGE, sender=from_addr))
+        logger.warning(_t("allowed_recipients_empty", sender=from_addr))
         return False
     
     # Check for exact email match
-    if from_addr in ALLOWED_RECIPIENTS:
+    if from_addr in ALLOWED_EMAILS:
         return True
     
     # Check for domain wildcard match (@domain.com)
-    sender_domain = "@" + from_addr.split("@")[-1]
-    if sender_domain in ALLOWED_RECIPIENTS:
-        return True
-    
-    return False
+    at = from_addr.rfind("@")
+    return at != -1 and from_addr[at:] in ALLOWED_DOMAINS
 
-def print_content(payload, suffix, description):
+def iter_decoded_payload(part):
     """
-    Unified function to handle temp file creation, printing, and cleanup.
-    Reduces code duplication across attachments and email body processing.
-    
-    Returns: (success: bool, temp_file_path: str)
-    """
-    # Security: Check payload size before processing
-    if len(payload) > MAX_FILE_SIZE_BYTES:
-        logger.warning(get_translation("file_exceeds_size", LANGUAGE, 
-                                      description=description, 
-                                      mb=MAX_FILE_SIZE_MB))
-        return False, None
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{suffix}") as tmpfile:
-        tmpfile.write(payload)
-        tmpfile_path = tmpfile.name
-    
-    logger.info(get_translation("printing_body" if "body" in description.lower() else "printing_attachment",
-                               LANGUAGE,
-                               filename=description,
-                               content_type=suffix,
-                               path=tmpfile_path))
-    success = print_file(tmpfile_path)
-    
-    # Always clean up temp file
+    Yield the transfer-decoded payload of a MIME part in blocks.
+    Base64 and quoted-printable payloads are decoded a few whole lines at a
+    time, so a large attachment is never held fully decoded in memory.
+    """
+    raw = part.get_payload()
+    if not isinstance(raw, str):
+        return
+
+    encoding = str(part.get("Content-Transfer-Encoding", "")).strip().lower()
+    if encoding == "base64" and raw.isascii():
+        leftover = ""
+        for start in range(0, len(raw), DECODE_CHUNK_SIZE):
+            # Line lengths need not be a multiple of 4, so drop the line breaks
+            # and carry an incomplete base64 quantum over into the next block
+            chunk = leftover + "".join(raw[start:start + DECODE_CHUNK_SIZE].split())
+            cut = len(chunk) - len(chunk) % 4
+            leftover = chunk[cut:]
+            yield binascii.a2b_base64(chunk[:cut])
+        if leftover:
+            yield binascii.a2b_base64(leftover)
+    elif encoding == "quoted-printable" and raw.isascii():
+        start = 0
+        while start < len(raw):
+            # Cut on a line boundary so no QP escape or soft line break is split
+            end = raw.find("\n", start + DECODE_CHUNK_SIZE)
+            end = len(raw) if end == -1 else end + 1
+            yield binascii.a2b_qp(raw[start:end])
+            start = end
+    else:
+        # 7bit/8bit/binary (or malformed) payloads are left to the email package
+        yield part.get_payload(decode=True) or b""
+
+def write_all(fd, data):
+    """Write bytes to a file descriptor in slices of a memoryview, without copying"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view[:WRITE_CHUNK_SIZE])
+        view = view[written:]
+
+def write_decoded(fd, blocks):
+    """
+    Write decoded payload blocks to a file descriptor, stopping as soon as
+    MAX_FILE_SIZE_BYTES is exceeded.
+    Returns: (number of bytes decoded, whether they were all whitespace)
+    """
+    size = 0
+    blank = True
+    for block in blocks:
+        size += len(block)
+        # Security: stop decoding as soon as the size limit is exceeded
+        if size > MAX_FILE_SIZE_BYTES:
+            break
+        if blank and block and not block.isspace():
+            blank = False
+        write_all(fd, block)
+    return size, blank
+
+def remove_temp_file(path):
+    """Delete a temporary file, logging the outcome"""
     try:
-        os.remove(tmpfile_path)
-        logger.info(get_translation("deleted_temp_file", LANGUAGE, path=tmpfile_path))
+        os.remove(path)
+        logger.info(_t("deleted_temp_file", path=path))
     except Exception as e:
-        logger.error(get_translation("failed_delete_temp", LANGUAGE, path=tmpfile_path, error=str(e)))
+        logger.error(_t("failed_delete_temp", path=path, error=str(e)))
+
+def has_encoded_content(part):
+    """
+    Cheap emptiness check on the still-encoded payload, so empty parts are
+    skipped before decoding. Content that only decodes to whitespace is
+    caught later by print_content.
+    """
+    payload = part.get_payload()
+    return isinstance(payload, str) and bool(payload) and not payload.isspace()
+
+# A MIME part queued for printing. empty_warning is logged if the part decodes
+# to whitespace only; confirm_name is the name reported in the confirmation.
+PrintJob = collections.namedtuple(
+    "PrintJob", ["part", "suffix", "description", "empty_warning", "confirm_name"]
+)
+
+def print_content(part, suffix, description, empty_warning):
+    """
+    Unified function to prepare attachments and email bodies for printing.
+    The part's payload is decoded straight into a temp file, which the caller
+    prints (see print_files) and then deletes. Content that decodes to
+    nothing but whitespace is skipped with empty_warning.
     
-    return success, tmpfile_path
+    Returns: temp file path, or None if the content cannot be printed
+    """
+    try:
+        fd, tmpfile_path = tempfile.mkstemp(suffix=f".{suffix}")
+    except OSError as e:
+        logger.error(_t("temp_file_failed", description=description, error=str(e)))
+        return None
+
+    try:
+        try:
+            try:
+                size, blank = write_decoded(fd, iter_decoded_payload(part))
+            except binascii.Error:
+                # Malformed encoding: start over with the email package's lenient decoder
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                size, blank = write_decoded(fd, [part.get_payload(decode=True) or b""])
+        finally:
+            os.close(fd)
+    except OSError as e:
+        # e.g. the disk is full
+        logger.error(_t("temp_file_failed", description=description, error=str(e)))
+        remove_temp_file(tmpfile_path)
+        return None
+
+    if size > MAX_FILE_SIZE_BYTES:
+        logger.warning(_t("file_exceeds_size", 
+                         description=description, 
+                         mb=MAX_FILE_SIZE_MB))
+        remove_temp_file(tmpfile_path)
+        return None
+
+    if blank:
+        logger.warning(empty_warning)
+        remove_temp_file(tmpfile_path)
+        return None
+
+    logger.info(_t("printing_body" if "body" in description.lower() else "printing_attachment",
+                   filename=description,
+                   content_type=suffix,
+                   path=tmpfile_path))
+    return tmpfile_path
 
 def process_email(msg):
     """Process a single email message: validate sender, print content, send confirmation"""
@@ -271,90 +610,126 @@ def process_email(msg):
     
     # Security: Validate sender BEFORE processing any content
     if not is_sender_allowed(from_addr):
-        logger.warning(get_translation("sender_not_allowed", LANGUAGE, sender=from_addr))
+        logger.warning(_t("sender_not_allowed", sender=from_addr))
         return
 
-    printed_files = []
-
-    log_stream = io.StringIO()
-    stream_handler = logging.StreamHandler(log_stream)
-    stream_handler.setFormatter(log_formatter)
-    logger.addHandler(stream_handler)
-
-    logger.info(get_translation("processing_email", LANGUAGE, sender=from_addr))
-    logger.info(get_translation("email_subject", LANGUAGE, subject=subject))
-    printed_any = False
-
-    # Detect if there are attachments
-    # This is to prevent printing the email body if not really needed
-    has_valid_attachments = False
-    for part in msg.walk():
-        if part.get_content_maintype() == 'multipart': 
-            continue
-        if part.get_filename():  # Has filename
-            fname = decode_mime_words(part.get_filename())
-            ext = os.path.splitext(fname)[1].lower().lstrip(".")
-            # Check if extension is allowed
-            if not ALLOWED_ATTACHMENT_TYPES or ext in ALLOWED_ATTACHMENT_TYPES:
-                has_valid_attachments = True
-                break
-    
-    if has_valid_attachments:
-        logger.info(get_translation("valid_attachments_found", LANGUAGE))
+    # PrintJobs for the parts to print
+    pending = []
+    # Temp files to print in one batch, with the name reported in the confirmation
+    print_jobs = []
 
-    for part in msg.walk():
-        content_type = part.get_content_type()
-        filename = part.get_filename()
-        payload = part.get_payload(decode=True)
+    # Records are only collected when the confirmation includes the log
+    log_capture = None
+    if DETAILED_CONFIRMATION:
+        log_capture = LogCaptureHandler(LOG_CAPTURE_MAX_RECORDS)
+        logger.addHandler(log_capture)
 
-        # Skip empty payloads early
-        if not payload or payload.strip() == b"":
+    try:
+        logger.info(_t("processing_email", sender=from_addr))
+        logger.info(_t("email_subject", subject=subject))
+
+        # Walk the MIME tree once, splitting leaf parts into attachments and bodies
+        attachments = []
+        body_parts = []
+        for part in msg.walk():
+            if part.get_content_maintype() == 'multipart': 
+                continue
+            filename = decode_mime_words(part.get_filename())
             if filename:
-                logger.warning(get_translation("attachment_empty", LANGUAGE, 
-                                             filename=decode_mime_words(filename),
-                                             content_type=content_type))
-            else:
-                logger.warning(get_translation("body_empty", LANGUAGE, content_type=content_type))
-            continue
-
-        if filename:
-            filename = decode_mime_words(filename)
-            suffix = os.path.splitext(filename)[1].lower().lstrip(".")
+                suffix = os.path.splitext(filename)[1].lower().lstrip(".")
+                attachments.append((part, filename, suffix))
+            elif part.get_content_type() in ["text/plain", "text/html"]:
+                body_parts.append(part)
+
+        # Detect if there are attachments
+        # This is to prevent printing the email body if not really needed
+        has_valid_attachments = any(
+            not ALLOWED_ATTACHMENT_TYPES or suffix in ALLOWED_ATTACHMENT_TYPES
+            for _, _, suffix in attachments
+        )
+    
+        if has_valid_attachments:
+            logger.info(_t("valid_attachments_found"))
 
+        for part, filename, suffix in attachments:
+            # Check the extension first so disallowed payloads are never touched
             if ALLOWED_ATTACHMENT_TYPES and suffix not in ALLOWED_ATTACHMENT_TYPES:
-                logger.warning(get_translation("attachment_not_allowed", LANGUAGE, 
-                                             filename=filename, 
-                                             ext=suffix))
+                logger.warning(_t("attachment_not_allowed", 
+                                filename=filename, 
+                                ext=suffix))
+                continue
+
+            empty_warning = _t("attachment_empty",
+                               filename=filename,
+                               content_type=part.get_content_type())
+            if not has_encoded_content(part):
+                logger.warning(empty_warning)
                 continue
 
-            # Use unified print function
-            success, _ = print_content(payload, suffix, f"attachment '{filename}'")
-            if success:
-                printed_any = True
-                printed_files.append(filename)
+            pending.append(PrintJob(part, suffix, f"attachment '{filename}'", empty_warning, filename))
 
-        elif content_type in ["text/plain", "text/html"]:
-            # Prevent printing body if the email has attachments
-            if has_valid_attachments:
+        # Prevent printing body if the email has attachments
+        if has_valid_attachments:
+            body_parts = []
+
+        for part in body_parts:
+            content_type = part.get_content_type()
+
+            empty_warning = _t("body_empty", content_type=content_type)
+            if not has_encoded_content(part):
+                logger.warning(empty_warning)
                 continue
-            
-            if content_type == "text/html" and is_mostly_html_blank(payload.decode(errors="ignore")):
-                logger.warning(get_translation("html_blank", LANGUAGE))
+        
+            if content_type == "text/html" and is_mostly_html_blank(part.get_payload(decode=True)):
+                logger.warning(_t("html_blank"))
                 continue
 
-            # Use unified print function
-            success, _ = print_content(payload, "txt", f"email body ({content_type})")
-            if success:
-                printed_any = True
-                printed_files.append(f"EmailBody-{content_type}")
-
-    if not printed_any:
-        logger.warning(get_translation("no_printable_content", LANGUAGE))
+            pending.append(PrintJob(part, "txt", f"email body ({content_type})", empty_warning,
+                                    f"EmailBody-{content_type}"))
 
-    stream_handler.flush()
-    logger.removeHandler(stream_handler)
-    send_confirmation_email(from_addr, log_stream.getvalue(), printed_files)
-    log_stream.close()
+        printed_files = []
+        try:
+            # Decode the parts into temp files concurrently; they share no state
+            if len(pending) == 1:
+                # A single part is decoded in place; a pool would only add overhead
+                job = pending[0]
+                path = print_content(job.part, job.suffix, job.description, job.empty_warning)
+                if path:
+                    print_jobs.append((path, job.confirm_name))
+            elif pending:
+                with ThreadPoolExecutor(max_workers=min(MAX_PRINT_WORKERS, len(pending))) as executor:
+                    futures = [
+                        executor.submit(print_content, job.part, job.suffix,
+                                        job.description, job.empty_warning)
+                        for job in pending
+                    ]
+                # Record every temp file written before re-raising a failed job,
+                # so none of them is left behind
+                for future, job in zip(futures, pending):
+                    if future.exception() is None and future.result():
+                        print_jobs.append((future.result(), job.confirm_name))
+                for future in futures:
+                    future.result()
+
+            if print_jobs:
+                printed_paths = print_files([path for path, _ in print_jobs])
+                printed_files = [name for path, name in print_jobs if path in printed_paths]
+        finally:
+            # Always clean up temp files
+            for path, _ in print_jobs:
+                remove_temp_file(path)
+
+        if not printed_files:
+            logger.warning(_t("no_printable_content"))
+    finally:
+        # Never leave the handler behind, or it would collect every later record
+        if log_capture is not None:
+            logger.removeHandler(log_capture)
+
+    log_text = ""
+    if log_capture is not None:
+        log_text = "\n".join(log_formatter.format(record) for record in log_capture.records)
+    send_confirmation_email(from_addr, log_text, printed_files)
 
 def connect_imap_with_retry():
     """
@@ -363,66 +738,187 @@ def connect_imap_with_retry():
     """
     for attempt in range(MAX_IMAP_RETRIES):
         try:
-            logger.info(get_translation("connecting_imap", LANGUAGE, 
-                                       attempt=attempt + 1, 
-                                       max_attempts=MAX_IMAP_RETRIES))
+            logger.info(_t("connecting_imap", 
+                          attempt=attempt + 1, 
+                          max_attempts=MAX_IMAP_RETRIES))
             client = imapclient.IMAPClient(IMAP_SERVER, ssl=True, port=IMAP_PORT)
             client.login(EMAIL_ACCOUNT, EMAIL_PASSWORD)
-            logger.info(get_translation("imap_connected", LANGUAGE))
+            logger.info(_t("imap_connected"))
             return client
         except Exception as e:
-            logger.error(get_translation("imap_failed", LANGUAGE, attempt=attempt + 1, error=str(e)))
+            logger.error(_t("imap_failed", attempt=attempt + 1, error=str(e)))
             if attempt == MAX_IMAP_RETRIES - 1:
-                logger.error(get_translation("max_retries_reached", LANGUAGE))
+                logger.error(_t("max_retries_reached"))
                 raise
             # Exponential backoff
             delay = IMAP_RETRY_DELAY * (attempt + 1)
-            logger.info(get_translation("retrying_in", LANGUAGE, seconds=delay))
+            logger.info(_t("retrying_in", seconds=delay))
             time.sleep(delay)
 
+def parse_email(raw_email):
+    """
+    Parse a raw RFC822 message with BytesFeedParser, feeding it in blocks
+    rather than handing the whole message to message_from_bytes at once.
+    """
+    parser = BytesFeedParser(policy=compat32)
+    for start in range(0, len(raw_email), FEED_CHUNK_SIZE):
+        parser.feed(raw_email[start:start + FEED_CHUNK_SIZE])
+    return parser.close()
+
+# Set to cut the sleep between scans short
+_wake = threading.Event()
+# Set on SIGTERM/SIGINT to leave the main loop
+_stop = threading.Event()
+
+def process_inbox(client):
+    """Fetch, print and flag all unseen messages in the selected folder"""
+    messages = client.search(["UNSEEN"])
+    logger.info(_t("found_messages", count=len(messages)))
+
+    if not messages:
+        logger.info(_t("no_new_messages"))
+        return
+
+    # BODY.PEEK[] leaves \Seen untouched so flags are only set once the
+    # messages were handled, in a single command for the whole batch
+    handled_uids = []
+    failed_uids = []
+    response = client.fetch(messages, ["BODY.PEEK[]"])
+    for uid in list(response):
+        # Pop each raw message so it can be freed as soon as it was parsed
+        raw_email = response.pop(uid)[b"BODY[]"]
+        try:
+            msg = parse_email(raw_email)
+            process_email(msg)
+        except Exception as e:
+            logger.error(_t("email_processing_failed", uid=uid, error=str(e)), exc_info=True)
+            failed_uids.append(uid)
+        else:
+            handled_uids.append(uid)
+
+    # Mark as seen or deletion. Failed messages are only marked as seen, never
+    # deleted, so a broken email is not retried forever but stays recoverable
+    if DELETE_AFTER_PRINT and handled_uids:
+        client.delete_messages(handled_uids)
+        for uid in handled_uids:
+            logger.info(_t("email_marked_deletion", uid=uid))
+
+        # Delete (expunge) marked mails
+        client.expunge()
+        logger.info(_t("messages_expunged"))
+        if failed_uids:
+            client.add_flags(failed_uids, [b"\\Seen"])
+    else:
+        client.add_flags(handled_uids + failed_uids, [b"\\Seen"])
+
+def wait_for_new_messages(client):
+    """
+    Block in IMAP IDLE until the server pushes an EXISTS notification,
+    the IDLE refresh timeout expires or a shutdown is requested.
+    """
+    logger.info(_t("idle_waiting"))
+    client.idle()
+    try:
+        deadline = time.monotonic() + IDLE_TIMEOUT
+        # Check in short slices so a shutdown request is noticed promptly
+        while not _stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            responses = client.idle_check(timeout=min(remaining, IDLE_CHECK_INTERVAL))
+            if any(len(resp) > 1 and resp[1] == b"EXISTS" for resp in responses):
+                break
+    finally:
+        client.idle_done()
+
+def close_imap(client):
+    """Log out of an IMAP session, ignoring errors from a dead connection"""
+    if client is None:
+        return
+    try:
+        client.logout()
+    except Exception:
+        pass
+
+def sleep_with_keepalive(client, seconds):
+    """
+    Sleep until the next scan, sending NOOP whenever the session would otherwise
+    stay quiet longer than IMAP_KEEPALIVE so the server does not drop it.
+    Returns early when _wake is set.
+    """
+    logger.info(_t("sleeping", seconds=seconds))
+    while client is not None and seconds > IMAP_KEEPALIVE:
+        if _wake.wait(IMAP_KEEPALIVE):
+            break
+        seconds -= IMAP_KEEPALIVE
+        try:
+            client.noop()
+        except IMAP_ERRORS:
+            # The NOOP at the start of the next scan will trigger a reconnect
+            break
+    else:
+        _wake.wait(seconds)
+    _wake.clear()
+
+def request_shutdown(signum, frame):
+    """Signal handler: leave the main loop after the current step"""
+    # No logging here: the handler may interrupt a thread holding the log queue lock
+    _stop.set()
+    _wake.set()
+
 def main_loop():
     """Main processing loop with error handling and reconnection logic"""
-    logger.info(get_translation("starting_script", LANGUAGE))
+    logger.info(_t("starting_script"))
     
-    while True:
+    # A single IMAP session is kept for the process lifetime and only
+    # re-established after a connection error
+    client = None
+    while not _stop.is_set():
         try:
-            # Establish connection with retry logic
-            with connect_imap_with_retry() as client:
+            if client is None:
+                # Establish connection with retry logic
+                client = connect_imap_with_retry()
                 client.select_folder("INBOX")
-                messages = client.search(["UNSEEN"])
-                logger.info(get_translation("found_messages", LANGUAGE, count=len(messages)))
-
-                if messages:
-                    for uid, msg_data in client.fetch(messages, "RFC822").items():
-                        raw_email = msg_data[b"RFC822"]
-                        msg = email.message_from_bytes(raw_email)
-                        process_email(msg)
-                        
-                        # Mark as seen or deletion
-                        if DELETE_AFTER_PRINT:
-                            client.delete_messages(uid)
-                            logger.info(get_translation("email_marked_deletion", LANGUAGE, uid=uid))
-                        else:
-                            client.add_flags(uid, [b"\\Seen"])
-                    
-                    # Delete (expunge) marked mails
-                    if DELETE_AFTER_PRINT:
-                        client.expunge()
-                        logger.info(get_translation("messages_expunged", LANGUAGE))
-                else:
-                    logger.info(get_translation("no_new_messages", LANGUAGE))
-                    
+                if not client.has_capability("IDLE"):
+                    logger.info(_t("idle_not_supported"))
+            else:
+                # Cheap round-trip to detect sessions silently dropped by the server
+                client.noop()
+
+            if client.has_capability("IDLE"):
+                # Let the server push new mail instead of polling
+                process_inbox(client)
+                while not _stop.is_set():
+                    wait_for_new_messages(client)
+                    # Search after every IDLE cycle, timeouts included: an EXISTS
+                    # sent while the last scan ran or before the server
+                    # acknowledged IDLE is never seen by idle_check
+                    if not _stop.is_set():
+                        process_inbox(client)
+            else:
+                process_inbox(client)
+
+        except IMAP_ERRORS as e:
+            logger.error(_t("imap_connection_lost", error=str(e)))
+            close_imap(client)
+            client = None
         except Exception as e:
-            logger.error(get_translation("unexpected_error", LANGUAGE, error=str(e)), exc_info=True)
+            logger.error(_t("unexpected_error", error=str(e)), exc_info=True)
             # Continue running even after errors
 
-        logger.info(get_translation("sleeping", LANGUAGE, seconds=SLEEP_TIME))
-        time.sleep(SLEEP_TIME)
+        if not _stop.is_set():
+            sleep_with_keepalive(client, SLEEP_TIME)
+
+    # Log out instead of leaving the session to time out on the server
+    logger.info(_t("shutting_down"))
+    close_imap(client)
 
 if __name__ == "__main__":
-    print(get_translation("monitoring_inbox", LANGUAGE, email=EMAIL_ACCOUNT))
-    print(get_translation("printing_to", LANGUAGE, printer=PRINTER_NAME))
-    print(get_translation("scan_interval", LANGUAGE, seconds=SLEEP_TIME))
-    print(get_translation("max_file_size", LANGUAGE, mb=MAX_FILE_SIZE_MB))
+    print(_t("monitoring_inbox", email=EMAIL_ACCOUNT))
+    print(_t("printing_to", printer=PRINTER_NAME))
+    print(_t("scan_interval", seconds=SLEEP_TIME))
+    print(_t("max_file_size", mb=MAX_FILE_SIZE_MB))
     logger.info(f"Language: {LANGUAGE}")
+    signal.signal(signal.SIGTERM, request_shutdown)
+    signal.signal(signal.SIGINT, request_shutdown)
     main_loop()
@@ -0,0 +1,198 @@
+"""
+Internationalization (i18n) support for email2print
+Add new languages by creating a new module in this package (e.g. fr.py)
+defining a DATA dictionary with the same structure as en.py
+"""
+
+import functools
+import importlib
+import operator
+import pkgutil
+import string
+import sys
+from types import MappingProxyType
+
+def _format_renderer(template):
+    """Render a template with str.format, returning it raw if parameters are missing"""
+    def render(kwargs):
+        try:
+            return template.format_map(kwargs)
+        except KeyError:
+            return template
+    return render
+
+def _compile(template):
+    """
+    Pre-parse a translation template once, at import time.
+    
+    Returns the finished string for templates without placeholders, otherwise
+    a function that renders the template from a dict of format parameters.
+    Each template is turned into an equivalent f-string lambda whose
+    arguments are filled from the parameter dict, so rendering runs
+    compiled formatting code instead of re-parsing the template.
+    """
+    literals = []
+    body = []
+    fields = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        literals.append(literal)
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if not field.isidentifier() or "{" in spec:
+            # Indexed fields and nested format specs are left to str.format
+            return _format_renderer(template)
+        arg = "_%d" % len(fields)
+        if conversion:
+            arg += "!" + conversion
+        if spec:
+            arg += ":" + spec
+        body.append("{%s}" % arg)
+        fields.append(field)
+    
+    if not fields:
+        return "".join(literals)
+    
+    args = ", ".join("_%d" % i for i in range(len(fields)))
+    fill = eval("lambda %s: f%r" % (args, "".join(body)), {})
+    # Check for missing parameters up front instead of catching KeyError
+    if len(fields) == 1:
+        field = fields[0]
+        def render(kwargs):
+            if field in kwargs:
+                return fill(kwargs[field])
+            # If parameters are missing, return the raw translation
+            return template
+        return render
+    
+    getter = operator.itemgetter(*fields)
+    required = frozenset(fields)
+    def render(kwargs):
+        if kwargs.keys() >= required:
+            return fill(*getter(kwargs))
+        # If parameters are missing, return the raw translation
+        return template
+    return render
+
+# Language modules in this package, e.g. "es" for es.py
+_AVAILABLE_LANGUAGES = tuple(sorted(
+    name for _, name, is_pkg in pkgutil.iter_modules(__path__) if not is_pkg
+))
+
+# Compiled translations of each loaded language merged over English, so a
+# single lookup already includes the fallback. Literal messages are stored
+# as strings, templates as render functions.
+_MERGED = {}
+# Translations of the languages loaded so far, and a read-only view of them
+_LOADED = {}
+TRANSLATIONS = MappingProxyType(_LOADED)
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(render, kwargs_items):
+    """
+    Memoized rendering for the messages a translator was asked to memoize.
+    Items are (name, type, value) so that equal values of different types
+    (e.g. 5 and 5.0) do not share an entry.
+    """
+    return render({name: value for name, _, value in kwargs_items})
+
+def _memoize(render):
+    """Wrap a render function so repeated parameters reuse the rendered text"""
+    def render_cached(kwargs):
+        try:
+            return _render_cached(render, tuple(
+                (name, type(value), value) for name, value in kwargs.items()
+            ))
+        except TypeError:
+            # Unhashable parameters cannot be cached
+            return render(kwargs)
+    return render_cached
+
+def _load(lang):
+    """
+    Import and compile a language module the first time it is requested.
+    Keys and language codes are interned so lookups with literal keys
+    compare by identity. Translations are interned as well, so a literal
+    message shares one string object between the raw and compiled tables
+    and with identical text in other languages.
+    
+    Returns the merged translations of the language, or the English ones
+    if there is no module for it.
+    """
+    merged = _MERGED.get(lang)
+    if merged is not None:
+        return merged
+    if lang not in _AVAILABLE_LANGUAGES:
+        return _MERGED["en"]
+    
+    strings = importlib.import_module("." + lang, __name__).DATA
+    lang = sys.intern(lang)
+    compiled = {}
+    for key, template in strings.items():
+        template = strings[key] = sys.intern(template)
+        if not template and lang != "en":
+            # Empty translations fall back to English
+            continue
+        entry = _compile(template)
+        if isinstance(entry, str):
+            entry = sys.intern(entry)
+        compiled[sys.intern(key)] = entry
+    merged = _MERGED[lang] = {**_MERGED.get("en", {}), **compiled}
+    _LOADED[lang] = MappingProxyType(strings)
+    return merged
+
+# English is loaded up front as the fallback for every other language
+_load("en")
+
+def get_translation(key, lang="en", **kwargs):
+    """
+    Get translated string for a given key and language.
+    Falls back to English if language or key not found.
+    
+    Args:
+        key: Translation key
+        lang: Language code (e.g., 'en', 'es')
+        **kwargs: Format parameters for the translation string
+    
+    Returns:
+        Translated and formatted string
+    """
+    try:
+        translations = _MERGED[lang]
+    except KeyError:
+        translations = _load(lang)
+    render = translations.get(key, key)
+    # Literal strings need no formatting
+    if isinstance(render, str):
+        return render
+    return render(kwargs)
+
+def make_translator(lang, memoize=()):
+    """
+    Return a translate(key, **kwargs) function for a single language.
+    
+    The language and its English fallback are resolved once, so each call
+    is one key lookup plus formatting. Keys must be strings.
+    
+    Args:
+        lang: Language code (e.g., 'en', 'es')
+        memoize: Keys of messages repeated with the same parameters, whose
+            rendered text is cached. Leave out messages with unique values
+            such as errors or paths; they would only fill the cache.
+    """
+    translations = dict(_load(lang))
+    for key in memoize:
+        render = translations.get(key)
+        if callable(render):
+            translations[key] = _memoize(render)
+    
+    def translate(key, **kwargs):
+        render = translations.get(key, key)
+        if isinstance(render, str):
+            return render
+        return render(kwargs)
+    return translate
+
+def get_available_languages():
+    """Return tuple of available language codes"""
+    return _AVAILABLE_LANGUAGES
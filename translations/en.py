@@ -0,0 +1,65 @@
+"""
+English translations for email2print
+"""
+
+DATA = {
+    # Log messages
+    "starting_script": "Starting email2print script",
+    "monitoring_inbox": "Monitoring inbox: {email}",
+    "printing_to": "Printing to printer: {printer}",
+    "scan_interval": "Scan interval: {seconds} seconds",
+    "max_file_size": "Max file size: {mb} MB",
+    "connecting_imap": "Connecting to IMAP server (attempt {attempt}/{max_attempts})",
+    "imap_connected": "IMAP connection established successfully",
+    "imap_failed": "IMAP connection attempt {attempt} failed: {error}",
+    "max_retries_reached": "Max IMAP connection retries reached. Raising exception.",
+    "imap_connection_lost": "IMAP connection lost, reconnecting: {error}",
+    "retrying_in": "Retrying in {seconds} seconds...",
+    "found_messages": "Found {count} unseen messages",
+    "no_new_messages": "No new messages.",
+    "idle_waiting": "Waiting for new messages (IMAP IDLE)...",
+    "idle_not_supported": "IMAP server does not support IDLE. Falling back to polling.",
+    "processing_email": "Processing email from: {sender}",
+    "email_subject": "Subject: {subject}",
+    "valid_attachments_found": "Valid attachments found. Email body will be SKIPPED.",
+    "attachment_empty": "Attachment '{filename}' ({content_type}) is empty. Skipping print.",
+    "body_empty": "Email body ({content_type}) is empty. Skipping print.",
+    "attachment_not_allowed": "Attachment '{filename}' type .{ext} not allowed. Skipping.",
+    "html_blank": "HTML email body is blank after stripping tags. Skipping.",
+    "printing_attachment": "Printing attachment '{filename}': {path}",
+    "printing_body": "Printing email body ({content_type}): {path}",
+    "sent_to_printer": "Sent to printer: {printer} - File: {path}",
+    "print_job_submitted": "Print job {job_id} submitted to {printer}",
+    "printing_failed": "Printing failed for {path}: {error}",
+    "libreoffice_conversion_required": "File type .{ext} requires LibreOffice conversion",
+    "libreoffice_conversion_success": "LibreOffice conversion successful: {input} -> {output}",
+    "libreoffice_conversion_failed": "LibreOffice conversion failed: PDF not found at {path}",
+    "libreoffice_conversion_failed_cannot_print": "Failed to convert {path}, cannot print",
+    "libreoffice_timeout": "LibreOffice conversion timeout for {path}",
+    "libreoffice_error": "LibreOffice conversion failed for {path}: {error}",
+    "libreoffice_unexpected_error": "Unexpected error during LibreOffice conversion: {error}",
+    "temp_cleanup_failed": "Failed to clean up temp files: {error}",
+    "deleted_temp_file": "Deleted temporary file: {path}",
+    "failed_delete_temp": "Failed to delete temp file {path}: {error}",
+    "no_printable_content": "No printable content found in this email.",
+    "sending_confirmation": "Sending confirmation email to {email}",
+    "confirmation_sent": "Confirmation email sent.",
+    "confirmation_failed": "Error sending confirmation email: {error}",
+    "email_processing_failed": "Failed to process email {uid}: {error}",
+    "email_marked_deletion": "Email {uid} marked for deletion.",
+    "messages_expunged": "Deleted messages expunged from server.",
+    "sleeping": "Sleeping {seconds}s...",
+    "unexpected_error": "Unexpected error in main loop: {error}",
+    "shutting_down": "Shutdown requested. Logging out and exiting.",
+    "sender_not_allowed": "Sender {sender} not in ALLOWED_RECIPIENTS (nor domain match). Skipping print.",
+    "allowed_recipients_empty": "ALLOWED_RECIPIENTS is empty. Denying sender: {sender}",
+    "file_exceeds_size": "{description} exceeds max size ({mb}MB). Skipping.",
+    "temp_file_failed": "Failed to write {description} to a temp file: {error}",
+    "missing_env_var": "Missing required environment variable: {var}",
+    
+    # Confirmation email
+    "confirmation_subject_default": "Your Print Job Confirmation",
+    "confirmation_processed": "Your print job was processed:\n\n{log}",
+    "confirmation_printed": "{timestamp} – Your file '{filename}' was printed on printer '{printer}'",
+    "confirmation_no_files": "No files were printed.",
+}
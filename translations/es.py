@@ -0,0 +1,65 @@
+"""
+Spanish translations for email2print
+"""
+
+DATA = {
+    # Log messages
+    "starting_script": "Iniciando script email2print",
+    "monitoring_inbox": "Monitoreando bandeja: {email}",
+    "printing_to": "Imprimiendo en impresora: {printer}",
+    "scan_interval": "Intervalo de escaneo: {seconds} segundos",
+    "max_file_size": "Tamaño máximo de archivo: {mb} MB",
+    "connecting_imap": "Conectando al servidor IMAP (intento {attempt}/{max_attempts})",
+    "imap_connected": "Conexión IMAP establecida exitosamente",
+    "imap_failed": "Intento {attempt} de conexión IMAP falló: {error}",
+    "max_retries_reached": "Máximo de reintentos IMAP alcanzado. Lanzando excepción.",
+    "imap_connection_lost": "Conexión IMAP perdida, reconectando: {error}",
+    "retrying_in": "Reintentando en {seconds} segundos...",
+    "found_messages": "Se encontraron {count} mensajes no leídos",
+    "no_new_messages": "No hay mensajes nuevos.",
+    "idle_waiting": "Esperando mensajes nuevos (IMAP IDLE)...",
+    "idle_not_supported": "El servidor IMAP no soporta IDLE. Usando sondeo periódico.",
+    "processing_email": "Procesando correo electrónico de: {sender}",
+    "email_subject": "Asunto: {subject}",
+    "valid_attachments_found": "Se encontraron archivos adjuntos válidos. El cuerpo del correo electrónico será OMITIDO.",
+    "attachment_empty": "Adjunto '{filename}' ({content_type}) está vacío. Omitiendo impresión.",
+    "body_empty": "Cuerpo del correo electrónico ({content_type}) está vacío. Omitiendo impresión.",
+    "attachment_not_allowed": "Adjunto '{filename}' tipo .{ext} no permitido. Omitiendo.",
+    "html_blank": "Cuerpo HTML del correo electrónico está vacío después de quitar etiquetas. Omitiendo.",
+    "printing_attachment": "Imprimiendo adjunto '{filename}': {path}",
+    "printing_body": "Imprimiendo cuerpo del correo electrónico ({content_type}): {path}",
+    "sent_to_printer": "Enviado a impresora: {printer} - Archivo: {path}",
+    "print_job_submitted": "Trabajo de impresión {job_id} enviado a {printer}",
+    "printing_failed": "Impresión falló para {path}: {error}",
+    "libreoffice_conversion_required": "Tipo de archivo .{ext} requiere conversión con LibreOffice",
+    "libreoffice_conversion_success": "Conversión LibreOffice exitosa: {input} -> {output}",
+    "libreoffice_conversion_failed": "Conversión LibreOffice falló: PDF no encontrado en {path}",
+    "libreoffice_conversion_failed_cannot_print": "Falló la conversión de {path}, no se puede imprimir",
+    "libreoffice_timeout": "Timeout en conversión LibreOffice para {path}",
+    "libreoffice_error": "Conversión LibreOffice falló para {path}: {error}",
+    "libreoffice_unexpected_error": "Error inesperado durante conversión LibreOffice: {error}",
+    "temp_cleanup_failed": "Falló la limpieza de archivos temporales: {error}",
+    "deleted_temp_file": "Archivo temporal eliminado: {path}",
+    "failed_delete_temp": "Falló la eliminación del archivo temporal {path}: {error}",
+    "no_printable_content": "No se encontró contenido imprimible en este correo electrónico.",
+    "sending_confirmation": "Enviando correo electrónico de confirmación a {email}",
+    "confirmation_sent": "Correo electrónico de confirmación enviado.",
+    "confirmation_failed": "Error al enviar correo electrónico de confirmación: {error}",
+    "email_processing_failed": "Falló el procesamiento del correo electrónico {uid}: {error}",
+    "email_marked_deletion": "Correo electrónico {uid} marcado para eliminación.",
+    "messages_expunged": "Mensajes eliminados purgados del servidor.",
+    "sleeping": "Esperando {seconds}s...",
+    "unexpected_error": "Error inesperado en bucle principal: {error}",
+    "shutting_down": "Apagado solicitado. Cerrando sesión y saliendo.",
+    "sender_not_allowed": "Remitente {sender} no está en ALLOWED_RECIPIENTS (ni coincide dominio). Omitiendo impresión.",
+    "allowed_recipients_empty": "ALLOWED_RECIPIENTS está vacío. Denegando remitente: {sender}",
+    "file_exceeds_size": "{description} excede el tamaño máximo ({mb}MB). Omitiendo.",
+    "temp_file_failed": "No se pudo escribir {description} en un archivo temporal: {error}",
+    "missing_env_var": "Falta variable de entorno requerida: {var}",
+    
+    # Confirmation email
+    "confirmation_subject_default": "Confirmación de tu Trabajo de Impresión",
+    "confirmation_processed": "Tu trabajo de impresión fue procesado:\n\n{log}",
+    "confirmation_printed": "{timestamp} – Tu archivo '{filename}' fue impreso en la impresora '{printer}'",
+    "confirmation_no_files": "No se imprimieron archivos.",
+}